@@ -96,6 +96,9 @@ def get_svg_generation_approach() -> str:
 # Shared SEP-1577 multi-step loop
 # ---------------------------------------------------------------------------
 
+# Style presets accepted by the agentic SVG generator
+_STYLE_PRESETS = ("geometric", "organic", "technical", "heraldic", "abstract")
+
 _CAPABILITY_TOOLS = [
     get_inkscape_file_capabilities,
     get_inkscape_vector_capabilities,
@@ -248,11 +251,12 @@ def register_agentic_tools(mcp_instance=None):
                 "error": f"Invalid dimensions: '{dimensions}'. Use 'WIDTHxHEIGHT' (e.g. '800x600').",
             }
 
-        valid_styles = ["geometric", "organic", "technical", "heraldic", "abstract"]
-        if style_preset not in valid_styles:
+        if style_preset not in _STYLE_PRESETS:
             return {
                 "success": False,
-                "error": f"Invalid style_preset '{style_preset}'. Choose from: {valid_styles}",
+                "error": (
+                    f"Invalid style_preset '{style_preset}'. Choose from: {list(_STYLE_PRESETS)}"
+                ),
             }
 
         if ctx is None:
@@ -49,6 +49,9 @@ class InkscapeCliWrapper:
         if not Path(config.inkscape_executable).exists():
             raise InkscapeCliError(f"Inkscape executable not found: {config.inkscape_executable}")
 
+        # Caps how many Inkscape processes this wrapper runs at once; excess calls wait
+        self._process_slots = asyncio.Semaphore(getattr(config, "max_concurrent_processes", 3))
+
     async def export_file(
         self,
         input_path: str,
@@ -301,6 +304,13 @@ class InkscapeCliWrapper:
         return await self._execute_command(cmd_args, timeout)
 
     async def _execute_command(self, cmd_args: list[str], timeout: int) -> str:
+        """
+        Execute command once a process slot is free (see max_concurrent_processes).
+        """
+        async with self._process_slots:
+            return await self._run_command(cmd_args, timeout)
+
+    async def _run_command(self, cmd_args: list[str], timeout: int) -> str:
         """
         Execute command with proper error handling and logging.
         """
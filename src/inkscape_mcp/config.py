@@ -18,6 +18,10 @@ from pydantic import field_validator
 
 logger = logging.getLogger(__name__)
 
+# Accepted values for the validated string settings
+_INTERPOLATION_METHODS = ("none", "linear", "cubic", "lanczos")
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
 
 class InkscapeConfig(BaseModel):
     """
@@ -137,18 +141,18 @@ class InkscapeConfig(BaseModel):
     @classmethod
     def validate_interpolation(cls, v: str) -> str:
         """Validate interpolation method."""
-        valid_methods = ["none", "linear", "cubic", "lanczos"]
-        if v.lower() not in valid_methods:
-            raise ValueError(f"Invalid interpolation method: {v}. Must be one of {valid_methods}")
+        if v.lower() not in _INTERPOLATION_METHODS:
+            raise ValueError(
+                f"Invalid interpolation method: {v}. Must be one of {list(_INTERPOLATION_METHODS)}"
+            )
         return v.lower()
 
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate logging level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
+        if v.upper() not in _LOG_LEVELS:
+            raise ValueError(f"Invalid log level: {v}. Must be one of {list(_LOG_LEVELS)}")
         return v.upper()
 
     @classmethod
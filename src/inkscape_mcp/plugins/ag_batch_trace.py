@@ -5,11 +5,15 @@ Converts bitmaps to optimized SVG vectors with color quantization.
 Designed for Unity/VRChat workflows to reduce vertex counts and file sizes.
 """
 
+import os
 import subprocess
 from pathlib import Path
 
 import inkex
 
+# Bitmap formats picked up from the input directory
+_BITMAP_SUFFIXES = (".png", ".jpg", ".jpeg", ".bmp", ".tiff")
+
 
 class AGBatchTrace(inkex.EffectExtension):
     """Batch convert bitmaps to optimized SVG vectors."""
@@ -35,15 +39,22 @@ class AGBatchTrace(inkex.EffectExtension):
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Collect bitmaps from cached directory entries; only symlinks cost an extra stat
+        with os.scandir(input_dir) as entries:
+            bitmap_files = [
+                Path(entry.path)
+                for entry in entries
+                if entry.is_file() and entry.name.lower().endswith(_BITMAP_SUFFIXES)
+            ]
+
         # Process each bitmap file
         processed_count = 0
-        for file_path in input_dir.glob("*"):
-            if file_path.suffix.lower() in [".png", ".jpg", ".jpeg", ".bmp", ".tiff"]:
-                try:
-                    self._process_single_file(file_path, output_dir, num_colors, should_simplify)
-                    processed_count += 1
-                except Exception as e:
-                    inkex.errormsg(f"Error processing {file_path}: {e}")
+        for file_path in bitmap_files:
+            try:
+                self._process_single_file(file_path, output_dir, num_colors, should_simplify)
+                processed_count += 1
+            except Exception as e:
+                inkex.errormsg(f"Error processing {file_path}: {e}")
 
         inkex.errormsg(f"Batch trace completed. Processed {processed_count} files.")
 
@@ -69,11 +80,12 @@ class AGBatchTrace(inkex.EffectExtension):
 
         cmd.append(f"--actions={''.join(f'{action};' for action in actions)}")
 
-        # Execute the command
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        # Execute the command; stdout is unused and stderr is only decoded on failure
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=60)
 
         if result.returncode != 0:
-            raise Exception(f"Inkscape command failed: {result.stderr}")
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            raise Exception(f"Inkscape command failed: {stderr}")
 
         inkex.errormsg(f"Processed: {input_path.name} -> {output_path.name}")
 
@@ -5,8 +5,16 @@ Reduces color palette of SVG files to optimize for Unity/VRChat performance.
 Forces colors into specified palette to maintain brand consistency.
 """
 
+import re
+
 import inkex
-from inkex import PathElement
+import numpy as np
+
+# Clark-notation tag of <svg:path>, the elements whose colors get quantized
+_SVG_PATH_TAG = inkex.addNS("path", "svg")
+
+# #RRGGBB or #RGB, validated without int(..., 16) raising on bad input
+_HEX_COLOR_RE = re.compile(r"#(?:([0-9a-fA-F]{6})|([0-9a-fA-F]{3}))")
 
 
 class AGColorQuantize(inkex.EffectExtension):
@@ -28,12 +36,15 @@ class AGColorQuantize(inkex.EffectExtension):
         custom_palette = self._parse_palette(self.options.palette)
         should_dither = self.options.dither
 
+        # Single tree walk; both strategies work from the collected colors
+        color_refs = self._collect_color_refs()
+
         if custom_palette:
             # Use custom palette
-            self._apply_custom_palette(custom_palette)
+            self._apply_custom_palette(color_refs, custom_palette)
         else:
             # Auto-quantize to max_colors
-            self._quantize_colors(max_colors, should_dither)
+            self._quantize_colors(color_refs, max_colors, should_dither)
 
         inkex.errormsg(f"Color quantization completed. Max colors: {max_colors}")
 
@@ -44,47 +55,42 @@ class AGColorQuantize(inkex.EffectExtension):
 
         palette = []
         for color_str in palette_str.split(","):
-            color_str = color_str.strip()
-            if color_str.startswith("#"):
-                # Convert hex to RGB
-                try:
-                    r = int(color_str[1:3], 16)
-                    g = int(color_str[3:5], 16)
-                    b = int(color_str[5:7], 16)
-                    palette.append((r, g, b))
-                except ValueError:
-                    continue
+            rgb = self._hex_to_rgb(color_str.strip())
+            if rgb:
+                palette.append(rgb)
         return palette if palette else None
 
-    def _apply_custom_palette(self, palette):
-        """Apply custom color palette to all elements."""
-        for elem in self.svg.iter():
-            if isinstance(elem, PathElement):
-                # Get current fill color
-                fill_color = self._get_color_from_style(elem.style, "fill")
-                if fill_color:
-                    nearest_color = self._find_nearest_color(fill_color, palette)
-                    elem.style["fill"] = self._rgb_to_hex(nearest_color)
-
-                # Get current stroke color
-                stroke_color = self._get_color_from_style(elem.style, "stroke")
-                if stroke_color:
-                    nearest_color = self._find_nearest_color(stroke_color, palette)
-                    elem.style["stroke"] = self._rgb_to_hex(nearest_color)
-
-    def _quantize_colors(self, max_colors, _dither):
+    def _collect_color_refs(self):
+        """Collect (element, property, rgb) for every colored path fill and stroke."""
+        color_refs = []
+        for elem in self.svg.iter(_SVG_PATH_TAG):
+            style = elem.style
+            for prop in ("fill", "stroke"):
+                color = self._get_color_from_style(style, prop)
+                if color:
+                    color_refs.append((elem, prop, color))
+        return color_refs
+
+    def _apply_custom_palette(self, color_refs, palette):
+        """Apply custom color palette to the collected elements."""
+        if not color_refs:
+            return
+
+        # Palette lookup table: source RGB -> replacement hex
+        colors = list(dict.fromkeys(color for _, _, color in color_refs))
+        nearest = self._nearest_palette_indices(colors, palette)
+        lookup = {
+            color: self._rgb_to_hex(palette[index])
+            for color, index in zip(colors, nearest.tolist(), strict=True)
+        }
+
+        for elem, prop, color in color_refs:
+            elem.style[prop] = lookup[color]
+
+    def _quantize_colors(self, color_refs, max_colors, _dither):
         """Auto-quantize colors using median cut algorithm."""
-        # Collect all colors used in the document
-        colors = set()
-        for elem in self.svg.iter():
-            if isinstance(elem, PathElement):
-                fill_color = self._get_color_from_style(elem.style, "fill")
-                if fill_color:
-                    colors.add(fill_color)
-
-                stroke_color = self._get_color_from_style(elem.style, "stroke")
-                if stroke_color:
-                    colors.add(stroke_color)
+        # Distinct colors used in the document
+        colors = {color for _, _, color in color_refs}
 
         if len(colors) <= max_colors:
             return  # Already within limit
@@ -103,7 +109,7 @@ class AGColorQuantize(inkex.EffectExtension):
         ]
 
         # Apply the basic palette
-        self._apply_custom_palette(basic_palette[:max_colors])
+        self._apply_custom_palette(color_refs, basic_palette[:max_colors])
 
     def _get_color_from_style(self, style, property_name):
         """Extract RGB tuple from style property."""
@@ -113,19 +119,9 @@ class AGColorQuantize(inkex.EffectExtension):
 
         # Handle hex colors
         if color_str.startswith("#"):
-            try:
-                if len(color_str) == 7:  # #RRGGBB
-                    r = int(color_str[1:3], 16)
-                    g = int(color_str[3:5], 16)
-                    b = int(color_str[5:7], 16)
-                    return (r, g, b)
-                elif len(color_str) == 4:  # #RGB
-                    r = int(color_str[1] * 2, 16)
-                    g = int(color_str[2] * 2, 16)
-                    b = int(color_str[3] * 2, 16)
-                    return (r, g, b)
-            except ValueError:
-                pass
+            rgb = self._hex_to_rgb(color_str)
+            if rgb:
+                return rgb
 
         # Handle named colors (basic support)
         named_colors = {
@@ -141,22 +137,25 @@ class AGColorQuantize(inkex.EffectExtension):
 
         return named_colors.get(color_str.lower())
 
-    def _find_nearest_color(self, target_color, palette):
-        """Find the nearest color in the palette."""
-        min_distance = float("inf")
-        nearest = palette[0]
+    def _hex_to_rgb(self, color_str):
+        """Convert a #RRGGBB or #RGB string to an RGB tuple, or None if invalid."""
+        match = _HEX_COLOR_RE.fullmatch(color_str)
+        if match is None:
+            return None
 
-        for color in palette:
-            distance = self._color_distance(target_color, color)
-            if distance < min_distance:
-                min_distance = distance
-                nearest = color
+        long_form, short_form = match.groups()
+        if long_form is None:
+            long_form = "".join(digit * 2 for digit in short_form)
+        return tuple(bytes.fromhex(long_form))
 
-        return nearest
+    def _nearest_palette_indices(self, colors, palette):
+        """Find the index of the nearest palette color for each RGB color."""
+        targets = np.asarray(colors, dtype=np.int32)
+        palette_arr = np.asarray(palette, dtype=np.int32)
 
-    def _color_distance(self, color1, color2):
-        """Calculate Euclidean distance between two RGB colors."""
-        return sum((a - b) ** 2 for a, b in zip(color1, color2, strict=False)) ** 0.5
+        # Squared Euclidean distance; sqrt is monotonic so the argmin is unchanged
+        diffs = targets[:, None, :] - palette_arr[None, :, :]
+        return np.einsum("nkc,nkc->nk", diffs, diffs).argmin(axis=1)
 
     def _rgb_to_hex(self, rgb):
         """Convert RGB tuple to hex string."""
@@ -5,6 +5,8 @@ Creates CSS-animated SVGs from layers. Each layer becomes a keyframe in the anim
 Perfect for Unity web UI elements and lightweight animations.
 """
 
+import io
+
 import inkex
 from inkex import StyleElement
 
@@ -32,10 +34,10 @@ class AGLayerAnimation(inkex.EffectExtension):
             return
 
         # Create CSS keyframes
-        css_rules = self._create_keyframes(layers, duration, easing, should_loop)
+        css_text = self._create_keyframes(layers, duration, easing, should_loop)
 
         # Inject CSS into SVG
-        self._inject_css(css_rules)
+        self._inject_css(css_text)
 
         inkex.errormsg(f"Created {len(layers)}-frame CSS animation (duration: {duration}s).")
 
@@ -48,87 +50,35 @@ class AGLayerAnimation(inkex.EffectExtension):
 
     def _create_keyframes(self, layers, duration, easing, loop):
         """Create CSS keyframes from layers."""
-        css_rules = []
         num_frames = len(layers)
+        iterations = "infinite" if loop else "1"
+        frame_duration = duration / num_frames
 
-        # Calculate timing for each frame
-        duration / num_frames if num_frames > 1 else duration
+        # Frame boundaries as percentages, computed once for the keyframes below
+        frame_pct = [(i / num_frames) * 100 for i in range(num_frames)]
 
-        for i, layer in enumerate(layers):
-            layer_id = layer.get("id", f"layer_{i}")
-            start_percent = (i / num_frames) * 100
-            end_percent = ((i + 1) / num_frames) * 100
-
-            # Hide all layers initially
-            if i == 0:
-                css_rules.append(
-                    f"""
-                #{layer_id} {{
-                    opacity: 1;
-                    animation: ag_layer_anim {duration}s {easing} {"infinite" if loop else "1"};
-                }}
-                """.strip()
-                )
-            else:
-                css_rules.append(
-                    f"""
-                #{layer_id} {{
-                    opacity: 0;
-                    animation: ag_layer_anim {duration}s {easing} {"infinite" if loop else "1"};
-                }}
-                """.strip()
-                )
-
-        # Create the keyframe animation
-        keyframe_rules = []
-        for i in range(num_frames):
-            percent = (i / num_frames) * 100
-            keyframe_rules.append(
-                f"""
-            {percent:.1f}% {{
-                opacity: {"1" if i == 0 else "0"};
-            }}
-            """.strip()
-            )
+        css = io.StringIO()
 
-        # Add keyframes for each layer
+        # Main animation keyframes, shared by every layer
+        css.write("@keyframes ag_layer_anim {\n")
+        for i, pct in enumerate(frame_pct):
+            css.write(f"  {pct:.1f}% {{ opacity: {1 if i == 0 else 0}; }}\n")
+        css.write("}\n")
+
+        # One rule per layer, staggered by a frame; only the first starts visible
         for i, layer in enumerate(layers):
             layer_id = layer.get("id", f"layer_{i}")
-            start_percent = (i / num_frames) * 100
-            end_percent = ((i + 1) / num_frames) * 100
-
-            css_rules.append(
-                f"""
-            @keyframes ag_layer_anim_{layer_id} {{
-                0%, {start_percent:.1f}% {{
-                    opacity: 0;
-                    display: none;
-                }}
-                {start_percent + 0.1:.1f}%, {end_percent - 0.1:.1f}% {{
-                    opacity: 1;
-                    display: inline;
-                }}
-                {end_percent:.1f}%, 100% {{
-                    opacity: 0;
-                    display: none;
-                }}
-            }}
-            """.strip()
+            css.write(
+                f"#{layer_id} {{\n"
+                f"  opacity: {1 if i == 0 else 0};\n"
+                f"  animation: ag_layer_anim {duration}s {easing} {iterations};\n"
+                f"  animation-delay: {i * frame_duration:g}s;\n"
+                "}\n"
             )
 
-        # Main animation keyframes
-        css_rules.insert(
-            0,
-            f"""
-        @keyframes ag_layer_anim {{
-            {"".join(keyframe_rules)}
-        }}
-        """.strip(),
-        )
-
-        return css_rules
+        return css.getvalue()
 
-    def _inject_css(self, css_rules):
+    def _inject_css(self, css_text):
         """Inject CSS rules into the SVG document."""
         # Create or find defs element
         defs = self.svg.defs
@@ -138,7 +88,7 @@ class AGLayerAnimation(inkex.EffectExtension):
 
         # Create style element with CSS
         style_elem = StyleElement()
-        style_elem.text = "\n".join(css_rules)
+        style_elem.text = css_text
         defs.append(style_elem)
 
 
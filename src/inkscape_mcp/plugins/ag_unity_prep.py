@@ -8,6 +8,13 @@ and optimizing for game engine performance.
 import inkex
 from inkex import Group
 from inkex import PathElement
+from lxml import etree
+
+# Namespace URIs whose attributes are stripped by ``_strip_inkscape_attributes``
+_INKSCAPE_NAMESPACES = frozenset({inkex.NSS["inkscape"], inkex.NSS["sodipodi"]})
+
+# Style properties Unity's SVG importer doesn't support
+_UNITY_UNSUPPORTED_STYLE = ("filter", "marker", "marker-start", "marker-mid", "marker-end")
 
 
 class AGUnityPrep(inkex.EffectExtension):
@@ -40,13 +47,17 @@ class AGUnityPrep(inkex.EffectExtension):
         if reset_coords:
             self._reset_coordinates()
 
-        # Optimize paths if requested
-        if optimize_paths:
-            self._optimize_paths()
+        # Path optimization and metadata removal share a single tree walk
+        if optimize_paths or remove_metadata:
+            for elem in self.svg.iter():
+                if remove_metadata:
+                    self._strip_inkscape_attributes(elem)
+                if optimize_paths and isinstance(elem, PathElement):
+                    self._optimize_path(elem)
 
-        # Remove metadata if requested
+        # Remove Inkscape-specific defs if requested
         if remove_metadata:
-            self._remove_metadata()
+            self._remove_inkscape_defs()
 
         inkex.errormsg("SVG prepared for Unity import.")
 
@@ -92,50 +103,34 @@ class AGUnityPrep(inkex.EffectExtension):
         if self.svg.get("transform"):
             self.svg.set("transform", None)
 
-    def _optimize_paths(self):
-        """Optimize path complexity for Unity."""
-        for elem in self.svg.iter():
-            if isinstance(elem, PathElement):
-                # Remove unnecessary style attributes that Unity doesn't need
-                style_attrs_to_remove = [
-                    "filter",
-                    "marker",
-                    "marker-start",
-                    "marker-mid",
-                    "marker-end",
-                ]
-                for attr in style_attrs_to_remove:
-                    if attr in elem.style:
-                        del elem.style[attr]
-
-                # Ensure stroke-width is reasonable for UI
-                if "stroke-width" in elem.style:
-                    try:
-                        width = float(elem.style["stroke-width"])
-                        if width > 5:  # Cap maximum stroke width
-                            elem.style["stroke-width"] = "2px"
-                        elif width < 0.5:  # Minimum visible stroke
-                            elem.style["stroke-width"] = "1px"
-                    except ValueError:
-                        elem.style["stroke-width"] = "1px"
-
-    def _remove_metadata(self):
-        """Remove Inkscape-specific metadata."""
-        # Remove Inkscape namespace declarations
-        namespaces_to_remove = ["inkscape", "sodipodi"]
-
-        # Remove metadata elements
-        for elem in self.svg.iter():
-            # Remove Inkscape-specific attributes
-            attrs_to_remove = []
-            for attr_name in elem.attrib:
-                if any(ns in attr_name for ns in namespaces_to_remove):
-                    attrs_to_remove.append(attr_name)
+    def _optimize_path(self, elem):
+        """Optimize a single path's complexity for Unity."""
+        style = elem.style
+
+        # Remove unnecessary style attributes that Unity doesn't need
+        for attr in _UNITY_UNSUPPORTED_STYLE:
+            if attr in style:
+                del style[attr]
+
+        # Ensure stroke-width is reasonable for UI
+        if "stroke-width" in style:
+            try:
+                width = float(style["stroke-width"])
+                if width > 5:  # Cap maximum stroke width
+                    style["stroke-width"] = "2px"
+                elif width < 0.5:  # Minimum visible stroke
+                    style["stroke-width"] = "1px"
+            except ValueError:
+                style["stroke-width"] = "1px"
 
-            for attr in attrs_to_remove:
-                del elem.attrib[attr]
+    def _strip_inkscape_attributes(self, elem):
+        """Remove Inkscape-specific attributes, matched on namespace URI."""
+        for attr_name in list(elem.attrib):
+            if etree.QName(attr_name).namespace in _INKSCAPE_NAMESPACES:
+                del elem.attrib[attr_name]
 
-        # Remove defs that are Inkscape-specific
+    def _remove_inkscape_defs(self):
+        """Remove defs that are Inkscape-specific."""
         defs = self.svg.defs
         if defs is not None:
             children_to_remove = []
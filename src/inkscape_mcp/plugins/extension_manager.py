@@ -5,19 +5,116 @@ This module provides an extension architecture for Inkscape MCP functionality.
 Extensions are Python scripts that use the inkex library to manipulate SVG documents.
 """
 
+import asyncio
+import functools
+import json
 import logging
-import xml.etree.ElementTree as ET
+import os
+import platform
+import sys
+import tempfile
+from collections.abc import Mapping
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
+from stat import S_ISDIR
+from types import MappingProxyType
 from typing import Any
 
 from ..cli_wrapper import InkscapeCliWrapper
 from ..config import InkscapeConfig
 
+try:
+    from lxml import etree
+
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as etree  # noqa: N813
+
+    LXML_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Lower-cased platform.system(), resolved once at import
+_OS = platform.system().lower()
+
+# Upper bound on threads used to parse .inx files during discovery
+_MAX_DISCOVERY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Parsed-extension cache kept in a per-user directory under the configured temp
+# directory; bump the version whenever the cached fields change
+_DISCOVERY_CACHE_DIR = "inkscape_mcp_cache"
+_DISCOVERY_CACHE_FILE = "inkscape_mcp_extensions.json"
+_DISCOVERY_CACHE_VERSION = 1
+
+# Owner required of the cache directory and file; None where there are no uids (Windows)
+_UID = os.getuid() if hasattr(os, "getuid") else None
+
+
+def _to_int(value: str | None) -> int:
+    return int(value) if value else 0
+
+
+def _to_float(value: str | None) -> float:
+    return float(value) if value else 0.0
+
+
+def _to_bool(value: str | None) -> bool:
+    return value.lower() in ("true", "1", "yes") if value else False
+
+
+def _keep_default(value: str | None) -> str | None:
+    return value
 
-@dataclass
+
+# Converters for <param> default values, by declared param type; other types keep the raw text
+_DEFAULT_COERCERS = {"int": _to_int, "float": _to_float, "bool": _to_bool}
+
+
+def _iterparse_inx(inx_file: Path):
+    """Stream ``(event, element)`` start/end pairs from an .inx file.
+
+    Entities are never resolved and no URLs are fetched; the stdlib parser does
+    neither by default, so only lxml needs the options spelled out. lxml also
+    drops the indentation-only text nodes that make up much of an .inx file.
+    """
+    if LXML_AVAILABLE:
+        return etree.iterparse(
+            str(inx_file),
+            events=("start", "end"),
+            resolve_entities=False,
+            no_network=True,
+            remove_blank_text=True,
+        )
+    return etree.iterparse(str(inx_file), events=("start", "end"))
+
+
+@functools.cache
+def _default_extension_dirs() -> tuple[Path, ...]:
+    """Per-user and system Inkscape extension directories for this platform."""
+    if _OS == "windows":
+        return (Path.home() / "AppData" / "Roaming" / "inkscape" / "extensions",)
+    if _OS == "linux":
+        return (
+            Path.home() / ".config" / "inkscape" / "extensions",
+            Path("/usr/share/inkscape/extensions"),
+        )
+    if _OS == "darwin":  # macOS
+        return (
+            Path.home()
+            / "Library"
+            / "Application Support"
+            / "org.inkscape.Inkscape"
+            / "config"
+            / "extensions",
+        )
+    return ()
+
+
+@dataclass(slots=True, frozen=True)
 class ExtensionParameter:
     """Represents a parameter for an Inkscape extension."""
 
@@ -30,7 +127,7 @@ class ExtensionParameter:
     required: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InkscapeExtension:
     """Represents an Inkscape extension with its metadata and parameters."""
 
@@ -39,10 +136,58 @@ class InkscapeExtension:
     description: str
     python_file: Path
     inx_file: Path
-    parameters: list[ExtensionParameter]
+    parameters: tuple[ExtensionParameter, ...]
     category: str = "general"
 
 
+def _extension_to_dict(extension: InkscapeExtension) -> dict[str, Any]:
+    """Convert an extension to a JSON-serializable dict for the discovery cache."""
+    data = asdict(extension)
+    data["python_file"] = str(extension.python_file)
+    data["inx_file"] = str(extension.inx_file)
+    return data
+
+
+def _extension_info(extension: InkscapeExtension) -> Mapping[str, Any]:
+    """Build the read-only list_extensions entry for an extension."""
+    return MappingProxyType(
+        {
+            "id": extension.id,
+            "name": extension.name,
+            "description": extension.description,
+            "category": extension.category,
+            "parameters": tuple(
+                MappingProxyType(
+                    {
+                        "name": param.name,
+                        "type": param.type,
+                        "default": param.default,
+                        "description": param.description,
+                        "required": param.required,
+                    }
+                )
+                for param in extension.parameters
+            ),
+        }
+    )
+
+
+def _extension_from_dict(data: dict[str, Any]) -> InkscapeExtension:
+    """Rebuild an extension from its discovery cache dict."""
+    return InkscapeExtension(
+        **{
+            **data,
+            "python_file": Path(data["python_file"]),
+            "inx_file": Path(data["inx_file"]),
+            "category": sys.intern(data["category"]),
+            "parameters": tuple(
+                ExtensionParameter(**{**param, "type": sys.intern(param["type"])})
+                for param in data["parameters"]
+            ),
+        }
+    )
+
+
 class ExtensionManager:
     """Manages discovery, loading, and execution of Inkscape extensions."""
 
@@ -56,6 +201,12 @@ class ExtensionManager:
         self.cli_wrapper = cli_wrapper
         self.config = config
         self.extensions: dict[str, InkscapeExtension] = {}
+        # Extensions are not modified after discovery, so their listing entries are built once
+        self._extension_info: dict[str, Mapping[str, Any]] = {}
+        # Same entries indexed by category, then by extension id
+        self._by_category: dict[str, dict[str, Mapping[str, Any]]] = {}
+        # Running execute_extension calls, keyed by their arguments
+        self._inflight: dict[tuple, asyncio.Future] = {}
         self.logger = logging.getLogger(__name__)
 
     def discover_extensions(self, extension_dirs: list[str] | None = None) -> None:
@@ -66,63 +217,207 @@ class ExtensionManager:
                           If None, uses default Inkscape extension directories.
         """
         if extension_dirs is None:
-            # Default Inkscape extension directories
-            import platform
+            extension_dirs = (*_default_extension_dirs(), Path.cwd() / "extensions")
 
-            system = platform.system().lower()
+        # Collect every .inx up front so all directories share one worker pool. Directories
+        # reachable twice (symlinks, bind mounts, a repeated entry) are scanned once.
+        inx_files: list[Path] = []
+        seen_dirs: set[tuple[int, int]] = set()
+        for ext_dir in map(Path, extension_dirs):
+            try:
+                dir_stat = ext_dir.stat()
+            except OSError:
+                self.logger.debug("Extension directory not found: %s", ext_dir)
+                continue
+            dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+            if dir_key in seen_dirs:
+                continue
+            seen_dirs.add(dir_key)
+            inx_files.extend(self._find_inx_files(ext_dir))
+
+        if not inx_files:
+            return
 
-            if system == "windows":
-                extension_dirs = [
-                    Path.home() / "AppData" / "Roaming" / "inkscape" / "extensions",
-                    Path.cwd() / "extensions",
-                ]
-            elif system == "linux":
-                extension_dirs = [
-                    Path.home() / ".config" / "inkscape" / "extensions",
-                    Path("/usr/share/inkscape/extensions"),
-                    Path.cwd() / "extensions",
-                ]
-            elif system == "darwin":  # macOS
-                extension_dirs = [
-                    Path.home()
-                    / "Library"
-                    / "Application Support"
-                    / "org.inkscape.Inkscape"
-                    / "config"
-                    / "extensions",
-                    Path.cwd() / "extensions",
-                ]
-            else:
-                extension_dirs = [Path.cwd() / "extensions"]
+        # Files whose (mtime, size) match the cache are loaded without reparsing
+        cache = self._load_discovery_cache()
+        fresh_entries: dict[str, dict[str, Any]] = {}
+
+        # Parsing is file I/O plus C-level XML work, so threads overlap well. Results are
+        # consumed in submission order on this thread, which keeps the "later directory
+        # wins" override order and leaves self.extensions single-threaded.
+        log = self.logger
+        info_on = log.isEnabledFor(logging.INFO)
+        with ThreadPoolExecutor(max_workers=min(_MAX_DISCOVERY_WORKERS, len(inx_files))) as pool:
+            pending: list[tuple[Path, os.stat_result, Future | InkscapeExtension]] = []
+            seen_files: set[tuple[int, int]] = set()
+            for inx_file in inx_files:
+                try:
+                    stat = inx_file.stat()
+                except OSError as e:
+                    log.error("Error parsing extension %s: %s", inx_file, e)
+                    continue
+                file_key = (stat.st_dev, stat.st_ino)
+                if file_key in seen_files:
+                    continue
+                seen_files.add(file_key)
+
+                # The cache lives in a shared temp directory, so a malformed entry is
+                # treated as a miss
+                cached_extension = None
+                cached = cache.get(str(inx_file))
+                if cached is not None:
+                    try:
+                        if (
+                            cached["mtime_ns"] == stat.st_mtime_ns
+                            and cached["size"] == stat.st_size
+                            and Path(cached["extension"]["python_file"]).exists()
+                        ):
+                            cached_extension = _extension_from_dict(cached["extension"])
+                    except (KeyError, TypeError, ValueError) as e:
+                        log.debug("Ignoring malformed cache entry for %s: %s", inx_file, e)
+
+                if cached_extension is not None:
+                    pending.append((inx_file, stat, cached_extension))
+                else:
+                    pending.append((inx_file, stat, pool.submit(self._parse_inx_file, inx_file)))
+
+            for inx_file, stat, source in pending:
+                if isinstance(source, InkscapeExtension):
+                    extension = source
+                else:
+                    extension = source.result()
+                if extension:
+                    self.extensions[extension.id] = extension
+                    self._index_extension(extension)
+                    if info_on:
+                        log.info("Loaded extension: %s (%s)", extension.name, extension.id)
+                    fresh_entries[str(inx_file)] = {
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "extension": _extension_to_dict(extension),
+                    }
 
-        for ext_dir in extension_dirs:
-            self._discover_extensions_in_directory(Path(ext_dir))
+        # Replace the entries of the scanned directories, keep those of other directories
+        scanned_dirs = {Path(ext_dir) for ext_dir in extension_dirs}
+        entries = {
+            path: entry for path, entry in cache.items() if Path(path).parent not in scanned_dirs
+        }
+        entries.update(fresh_entries)
+        if entries != cache:
+            self._save_discovery_cache(entries)
+
+    def _index_extension(self, extension: InkscapeExtension) -> None:
+        """Store the listing entry of an extension, replacing one with the same id."""
+        info = _extension_info(extension)
+        previous = self._extension_info.get(extension.id)
+        if previous is not None:
+            self._by_category[previous["category"]].pop(extension.id, None)
+        self._extension_info[extension.id] = info
+        self._by_category.setdefault(extension.category, {})[extension.id] = info
+
+    def _discovery_cache_path(self) -> Path | None:
+        """Return the path of the parsed-extension cache file.
+
+        The temp directory is usually shared, so the cache lives in a 0o700 directory
+        owned by the current user, where other users can neither plant nor replace it.
 
-    def _discover_extensions_in_directory(self, ext_dir: Path) -> None:
-        """Discover extensions in a specific directory.
+        Returns:
+            Cache file path, or None if no private cache directory is available
+        """
+        cache_dir = Path(self.config.temp_directory) / (
+            _DISCOVERY_CACHE_DIR if _UID is None else f"{_DISCOVERY_CACHE_DIR}-{_UID}"
+        )
+        try:
+            cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            dir_stat = cache_dir.lstat()
+        except OSError as e:
+            self.logger.debug("Cannot use extension cache directory %s: %s", cache_dir, e)
+            return None
+
+        if _UID is not None and (
+            not S_ISDIR(dir_stat.st_mode) or dir_stat.st_uid != _UID or dir_stat.st_mode & 0o077
+        ):
+            self.logger.debug("Extension cache directory is not private: %s", cache_dir)
+            return None
+        return cache_dir / _DISCOVERY_CACHE_FILE
+
+    def _load_discovery_cache(self) -> dict[str, dict[str, Any]]:
+        """Load cached extensions keyed by .inx path.
+
+        Returns:
+            Mapping of .inx path to its mtime_ns, size and extension dict
+            (empty if the cache is missing, unreadable, malformed, owned by another
+            user or from another version)
+        """
+        cache_path = self._discovery_cache_path()
+        if cache_path is None:
+            return {}
+        try:
+            with cache_path.open(encoding="utf-8") as cache_file:
+                if _UID is not None and os.fstat(cache_file.fileno()).st_uid != _UID:
+                    return {}
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != _DISCOVERY_CACHE_VERSION:
+            return {}
+        entries = data.get("entries", {})
+        return entries if isinstance(entries, dict) else {}
+
+    def _save_discovery_cache(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Write the parsed-extension cache atomically.
 
         Args:
-            ext_dir: Directory to search for .inx files
+            entries: Mapping of .inx path to its mtime_ns, size and extension dict
         """
-        if not ext_dir.exists() or not ext_dir.is_dir():
-            self.logger.debug(f"Extension directory not found: {ext_dir}")
+        cache_path = self._discovery_cache_path()
+        if cache_path is None:
             return
+        tmp_name = None
+        try:
+            payload = json.dumps({"version": _DISCOVERY_CACHE_VERSION, "entries": entries})
+            # mkstemp opens with O_EXCL under an unpredictable name, so a file or symlink
+            # planted next to the cache cannot redirect the write
+            fd, tmp_name = tempfile.mkstemp(
+                dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                tmp_file.write(payload)
+            Path(tmp_name).replace(cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug("Could not write extension cache %s: %s", cache_path, e)
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
 
-        self.logger.info(f"Scanning extensions in: {ext_dir}")
+    def _find_inx_files(self, ext_dir: Path) -> list[Path]:
+        """Find the .inx files in a specific directory.
 
-        # Find all .inx files
-        for inx_file in ext_dir.glob("*.inx"):
-            try:
-                extension = self._parse_inx_file(inx_file)
-                if extension:
-                    self.extensions[extension.id] = extension
-                    self.logger.info(f"Loaded extension: {extension.name} ({extension.id})")
-            except Exception as e:
-                self.logger.error(f"Error parsing extension {inx_file}: {e}")
+        Args:
+            ext_dir: Directory to search for .inx files
+
+        Returns:
+            List of .inx file paths (empty if the directory cannot be read)
+        """
+        # DirEntry caches the file type, so only symlinked entries cost an extra stat
+        try:
+            with os.scandir(ext_dir) as entries:
+                self.logger.info("Scanning extensions in: %s", ext_dir)
+                return [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".inx") and entry.is_file()
+                ]
+        except OSError as e:
+            self.logger.debug("Cannot scan extension directory %s: %s", ext_dir, e)
+            return []
 
     def _parse_inx_file(self, inx_file: Path) -> InkscapeExtension | None:
         """Parse an .inx file to extract extension metadata.
 
+        The file is streamed in a single pass; each element is cleared once its
+        end tag has been handled, so no full document tree is kept around.
+
         Args:
             inx_file: Path to the .inx file
 
@@ -130,75 +425,107 @@ class ExtensionManager:
             InkscapeExtension instance or None if parsing failed
         """
         try:
-            tree = ET.parse(inx_file)
-            root = tree.getroot()
+            ext_id = None
+            name = None
+            script_command = None
+            menu_text = None
+            parameters: list[ExtensionParameter | None] = []
+
+            # Local names of the open elements, and slots of the open <param>s so
+            # nested params keep document order
+            open_tags: list[str] = []
+            open_params: list[int] = []
+
+            for event, elem in _iterparse_inx(inx_file):
+                # INX files declare a default namespace; dispatch on the local name
+                tag = elem.tag.rpartition("}")[2]
+
+                if event == "start":
+                    open_tags.append(tag)
+                    if tag == "param":
+                        open_params.append(len(parameters))
+                        parameters.append(None)
+                    continue
+
+                open_tags.pop()
+                parent = open_tags[-1] if open_tags else None
+
+                if tag == "id":
+                    if ext_id is None:
+                        ext_id = elem.text
+                elif tag == "name":
+                    if name is None:
+                        name = elem.text
+                elif tag == "command" and parent == "script":
+                    if script_command is None:
+                        script_command = elem.text
+                elif tag == "submenu" and parent == "effects-menu":
+                    if menu_text is None:
+                        menu_text = elem.text
+                elif tag == "param":
+                    parameters[open_params.pop()] = self._build_parameter(elem)
+
+                if parent is not None:
+                    elem.clear()
 
             # Extract basic metadata
-            ext_id = root.find(".//id")
-            if ext_id is None or not ext_id.text:
+            if not ext_id:
                 return None
-
-            name_elem = root.find(".//name")
-            name = name_elem.text if name_elem is not None else ext_id.text
+            if name is None:
+                name = ext_id
 
             # Find the Python script file
-            script_elem = root.find(".//script/command")
-            if script_elem is None:
+            if script_command is None:
                 return None
 
-            script_path = inx_file.parent / script_elem.text
+            script_path = inx_file.parent / script_command
             if not script_path.exists():
                 return None
 
-            # Parse parameters
-            parameters = []
-            for param in root.findall(".//param"):
-                param_name = param.get("name")
-                param_type = param.get("type", "string")
-                param_default = param.text or param.get("default")
-
-                # Convert default values based on type
-                if param_type == "int":
-                    param_default = int(param_default) if param_default else 0
-                elif param_type == "float":
-                    param_default = float(param_default) if param_default else 0.0
-                elif param_type == "bool":
-                    param_default = (
-                        param_default.lower() in ("true", "1", "yes") if param_default else False
-                    )
-
-                parameters.append(
-                    ExtensionParameter(
-                        name=param_name,
-                        type=param_type,
-                        default=param_default,
-                        min_val=float(param.get("min", 0)) if param.get("min") else None,
-                        max_val=float(param.get("max", 0)) if param.get("max") else None,
-                        description=param.get("gui-text", ""),
-                        required=param.get("required", "false").lower() == "true",
-                    )
-                )
-
-            # Determine category from menu path
+            # Determine category from menu path; categories and parameter types come from
+            # small vocabularies, so they are interned and shared across extensions
             category = "general"
-            menu_elem = root.find(".//effects-menu/submenu")
-            if menu_elem is not None and menu_elem.text:
-                category = menu_elem.text.lower().replace(" ", "_")
+            if menu_text:
+                category = sys.intern(menu_text.lower().replace(" ", "_"))
 
             return InkscapeExtension(
-                id=ext_id.text,
+                id=ext_id,
                 name=name,
                 description=name,  # Could be enhanced to parse description
                 python_file=script_path,
                 inx_file=inx_file,
-                parameters=parameters,
+                parameters=tuple(parameters),
                 category=category,
             )
 
-        except Exception as e:
-            self.logger.error(f"Error parsing {inx_file}: {e}")
+        except (etree.ParseError, OSError, ValueError) as e:
+            self.logger.error("Error parsing %s: %s", inx_file, e)
             return None
 
+    def _build_parameter(self, param) -> ExtensionParameter:
+        """Build an ExtensionParameter from a <param> element.
+
+        Args:
+            param: Parsed <param> element
+
+        Returns:
+            ExtensionParameter with its default converted to the declared type
+        """
+        param_type = sys.intern(param.get("type", "string"))
+        raw_default = param.text or param.get("default")
+        min_val = param.get("min")
+        max_val = param.get("max")
+
+        return ExtensionParameter(
+            name=param.get("name"),
+            type=param_type,
+            default=_DEFAULT_COERCERS.get(param_type, _keep_default)(raw_default),
+            min_val=float(min_val) if min_val else None,
+            max_val=float(max_val) if max_val else None,
+            description=param.get("gui-text", ""),
+            required=param.get("required", "false").lower() == "true",
+        )
+
     async def execute_extension(
         self,
         extension_id: str,
@@ -217,6 +544,31 @@ class ExtensionManager:
         Returns:
             Dictionary with execution results
         """
+        # Identical calls already in flight share one Inkscape run
+        key = (
+            extension_id,
+            input_file,
+            output_file,
+            tuple(sorted((name, repr(value)) for name, value in (parameters or {}).items())),
+        )
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._run_extension(extension_id, input_file, output_file, parameters)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller being cancelled does not cancel the run for the others
+        return dict(await asyncio.shield(task))
+
+    async def _run_extension(
+        self,
+        extension_id: str,
+        input_file: str | None,
+        output_file: str | None,
+        parameters: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """Run one extension through the CLI wrapper (see execute_extension)."""
         if extension_id not in self.extensions:
             return {
                 "success": False,
@@ -227,23 +579,19 @@ class ExtensionManager:
         extension = self.extensions[extension_id]
 
         try:
-            # Build inkscape command
-            cmd = [str(self.config.inkscape_executable)]
-
-            if input_file:
-                cmd.append(input_file)
-
-            # Add extension parameter
-            cmd.extend(["--extension", extension_id])
-
-            # Add custom parameters
-            if parameters:
-                for param_name, param_value in parameters.items():
-                    cmd.extend([f"--{param_name}", str(param_value)])
-
-            # Add output handling
-            if output_file:
-                cmd.extend(["--export-filename", output_file, "--export-do"])
+            # Build inkscape command: executable, input, extension, custom parameters, output
+            cmd = list(
+                chain(
+                    (str(self.config.inkscape_executable),),
+                    (input_file,) if input_file else (),
+                    ("--extension", extension_id),
+                    chain.from_iterable(
+                        (f"--{param_name}", str(param_value))
+                        for param_name, param_value in (parameters or {}).items()
+                    ),
+                    ("--export-filename", output_file, "--export-do") if output_file else (),
+                )
+            )
 
             # Execute the command
             result = await self.cli_wrapper._execute_command(cmd, timeout=60)
@@ -259,42 +607,42 @@ class ExtensionManager:
             }
 
         except Exception as e:
-            self.logger.error(f"Error executing extension {extension_id}: {e}")
+            self.logger.error("Error executing extension %s: %s", extension_id, e)
             return {"success": False, "error": str(e), "extension_id": extension_id}
 
-    def list_extensions(self, category: str | None = None) -> list[dict[str, Any]]:
+    async def execute_extension_batch(self, specs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Execute several extension runs concurrently.
+
+        Each spec holds the keyword arguments of execute_extension. At most
+        config.max_concurrent_processes Inkscape processes run at once.
+
+        Args:
+            specs: List of execute_extension keyword-argument dicts
+
+        Returns:
+            List of execution results, in the same order as specs
+        """
+        sem = asyncio.Semaphore(self.config.max_concurrent_processes)
+
+        async def _run(spec: dict[str, Any]) -> dict[str, Any]:
+            async with sem:
+                return await self.execute_extension(**spec)
+
+        return list(await asyncio.gather(*(_run(spec) for spec in specs)))
+
+    def list_extensions(self, category: str | None = None) -> list[Mapping[str, Any]]:
         """List all available extensions.
 
         Args:
             category: Optional category filter
 
         Returns:
-            List of extension information
+            List of read-only extension information, with parameters as a tuple
         """
-        extensions = self.extensions.values()
-
         if category:
-            extensions = [ext for ext in extensions if ext.category == category]
-
-        return [
-            {
-                "id": ext.id,
-                "name": ext.name,
-                "description": ext.description,
-                "category": ext.category,
-                "parameters": [
-                    {
-                        "name": param.name,
-                        "type": param.type,
-                        "default": param.default,
-                        "description": param.description,
-                        "required": param.required,
-                    }
-                    for param in ext.parameters
-                ],
-            }
-            for ext in extensions
-        ]
+            return list(self._by_category.get(category, {}).values())
+
+        return list(self._extension_info.values())
 
     def get_extension(self, extension_id: str) -> InkscapeExtension | None:
         """Get extension by ID.
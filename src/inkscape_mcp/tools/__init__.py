@@ -45,18 +45,18 @@ __all__ = [
 ]
 
 # Tool metadata for discovery
-PORTMANTEAU_TOOLS = [
+PORTMANTEAU_TOOLS = (
     {
         "name": "inkscape_file",
         "function": inkscape_file,
         "category": "file_operations",
-        "operations": ["load", "save", "convert", "info", "validate", "list_formats"],
+        "operations": ("load", "save", "convert", "info", "validate", "list_formats"),
     },
     {
         "name": "inkscape_vector",
         "function": inkscape_vector,
         "category": "vector_operations",
-        "operations": [
+        "operations": (
             "trace_image",
             "generate_barcode_qr",
             "create_object",
@@ -89,45 +89,45 @@ PORTMANTEAU_TOOLS = [
             "object_raise",
             "object_lower",
             "set_document_units",
-        ],
+        ),
     },
     {
         "name": "inkscape_analysis",
         "function": inkscape_analysis,
         "category": "document_analysis",
-        "operations": [
+        "operations": (
             "quality",
             "statistics",
             "validate",
             "objects",
             "dimensions",
             "structure",
-        ],
+        ),
     },
     {
         "name": "inkscape_render",
         "function": inkscape_render,
         "category": "agent_vision",
-        "operations": ["export_preview", "export_multi_dpi", "get_document_summary"],
+        "operations": ("export_preview", "export_multi_dpi", "get_document_summary"),
     },
     {
         "name": "inkscape_validation",
         "function": inkscape_validation,
         "category": "validation",
-        "operations": [
+        "operations": (
             "validate_svg",
             "check_viewbox",
             "check_stroke_fill",
             "check_size_limits",
             "audit_web_svg",
             "audit_svg_pack",
-        ],
+        ),
     },
     {
         "name": "inkscape_sim_art",
         "function": inkscape_sim_art,
         "category": "sim_art",
-        "operations": [
+        "operations": (
             "list_presets",
             "svg_pack_batch",
             "build_icon_sheet",
@@ -136,13 +136,13 @@ PORTMANTEAU_TOOLS = [
             "push_gimp_texture_sheet",
             "stage_resonite_ui",
             "run_sim_pipeline",
-        ],
+        ),
     },
     {
         "name": "inkscape_system",
         "function": inkscape_system,
         "category": "system",
-        "operations": [
+        "operations": (
             "status",
             "execution_mode",
             "hands_in_command",
@@ -150,13 +150,13 @@ PORTMANTEAU_TOOLS = [
             "diagnostics",
             "version",
             "config",
-        ],
+        ),
     },
     {
         "name": "inkscape_layers",
         "function": inkscape_layers,
         "category": "layer_management",
-        "operations": [
+        "operations": (
             "list",
             "get",
             "create",
@@ -166,13 +166,14 @@ PORTMANTEAU_TOOLS = [
             "reorder",
             "lock",
             "unlock",
-        ],
+            "batch",
+        ),
     },
     {
         "name": "inkscape_animation",
         "function": inkscape_animation,
         "category": "animation",
-        "operations": [
+        "operations": (
             "list_presets",
             "apply_preset",
             "animate_element",
@@ -180,14 +181,17 @@ PORTMANTEAU_TOOLS = [
             "animate_motion",
             "animate_color",
             "css_animation",
-        ],
+        ),
     },
-]
+)
+
+# Tool functions in registration order, derived once from the metadata above
+_ALL_TOOLS = tuple(tool["function"] for tool in PORTMANTEAU_TOOLS)
 
 
 def get_all_tools():
     """Return all portmanteau tool functions for registration."""
-    return [tool["function"] for tool in PORTMANTEAU_TOOLS]
+    return _ALL_TOOLS
 
 
 def get_tool_metadata():
@@ -9,6 +9,7 @@ most ops are pure XML manipulation (no CLI needed).
 
 from __future__ import annotations
 
+import functools
 import re
 import time
 from pathlib import Path
@@ -34,6 +35,18 @@ _LAYER_RE = re.compile(
     r'(<g\b[^>]*inkscape:groupmode="layer"[^>]*>.*?</g>)', re.DOTALL
 )
 _ATTR_RE = re.compile(r'(\b[a-zA-Z_:][\w._:-]*)\s*=\s*["\']([^"\']*)["\']')
+# Opening tags only, used to find insertion points when reordering
+_LAYER_OPEN_RE = re.compile(r'<g\b[^>]*inkscape:groupmode="layer"[^>]*>')
+_SVG_OPEN_RE = re.compile(r"<svg\b[^>]*>")
+
+# Markup of an empty layer appended by "create"
+_NEW_LAYER_TAG = (
+    '<g\n'
+    '    inkscape:groupmode="layer"\n'
+    '    id="{id}"\n'
+    '    inkscape:label="{label}">\n'
+    '  </g>'
+)
 
 
 def _parse_svg_xml(path: str) -> str:
@@ -44,31 +57,37 @@ def _write_svg_xml(path: str, content: str) -> None:
     Path(path).write_text(content, encoding="utf-8")
 
 
-def _extract_layers(svg_xml: str) -> list[dict[str, str | None]]:
-    """Find all `<g inkscape:groupmode="layer">` elements and return their attributes."""
-    layers: list[dict[str, str | None]] = []
+def _scan_layers(svg_xml: str) -> list[tuple[str, dict[str, str]]]:
+    """Return (full_tag, attrs_dict) for every `<g inkscape:groupmode="layer">` element."""
+    scanned: list[tuple[str, dict[str, str]]] = []
     for match in _LAYER_RE.findall(svg_xml):
         tag = match[: match.index(">") + 1] if ">" in match else match
-        attrs: dict[str, str | None] = {}
-        for a_name, a_val in _ATTR_RE.findall(tag):
-            attrs[a_name] = a_val
-        layers.append({
-            "id": attrs.get("id"),
-            "label": attrs.get("inkscape:label"),
-            "style": attrs.get("style"),
-            "visible": "display:none" not in (attrs.get("style") or ""),
-            "locked": attrs.get("sodipodi:insensitive") == "true",
-        })
-    return layers
+        scanned.append((match, dict(_ATTR_RE.findall(tag))))
+    return scanned
+
+
+def _layer_info(attrs: dict[str, str]) -> dict[str, str | None]:
+    """Summarise a layer's attributes as returned by list/get."""
+    style = attrs.get("style")
+    return {
+        "id": attrs.get("id"),
+        "label": attrs.get("inkscape:label"),
+        "style": style,
+        "visible": "display:none" not in (style or ""),
+        "locked": attrs.get("sodipodi:insensitive") == "true",
+    }
+
+
+def _extract_layers(svg_xml: str) -> list[dict[str, str | None]]:
+    """Find all `<g inkscape:groupmode="layer">` elements and return their attributes."""
+    return [_layer_info(attrs) for _, attrs in _scan_layers(svg_xml)]
 
 
 def _layer_by_id(svg_xml: str, layer_id: str) -> tuple[str | None, dict[str, str | None]]:
     """Return (full_tag, attrs_dict) for a layer matching the id, or (None, {})."""
     for match in _LAYER_RE.findall(svg_xml):
         tag_open = match[: match.index(">") + 1] if ">" in match else match
-        attrs: dict[str, str | None] = {}
-        for a_name, a_val in _ATTR_RE.findall(tag_open):
-            attrs[a_name] = a_val
+        attrs: dict[str, str | None] = dict(_ATTR_RE.findall(tag_open))
         if attrs.get("id") == layer_id:
             return match, attrs
     return None, {}
@@ -83,20 +102,29 @@ def _next_layer_id(svg_xml: str) -> str:
     return f"layer{len(existing) + 1}"
 
 
-def _set_layer_attr(svg_xml: str, layer_id: str, attr: str, value: str) -> str:
-    """Replace an attribute on a layer by id. Returns modified SVG XML."""
-    old_tag, _ = _layer_by_id(svg_xml, layer_id)
+@functools.cache
+def _attr_value_re(attr: str) -> re.Pattern[str]:
+    """Compiled `attr="..."` pattern; only a handful of attribute names are ever edited."""
+    return re.compile(rf'\b{re.escape(attr)}\s*=\s*["\'][^"\']*["\']')
+
+
+def _set_layer_attr(
+    svg_xml: str, layer_id: str, attr: str, value: str, old_tag: str | None = None
+) -> str:
+    """Replace an attribute on a layer by id. Returns modified SVG XML.
+
+    Pass `old_tag` when the caller already looked the layer up, to skip a second scan.
+    """
+    if old_tag is None:
+        old_tag, _ = _layer_by_id(svg_xml, layer_id)
     if old_tag is None:
         raise ValueError(f"Layer '{layer_id}' not found")
 
     # Replace or add the attribute in the opening tag
     tag_open = old_tag[: old_tag.index(">") + 1]
     if f'{attr}="' in tag_open or f"{attr}='" in tag_open:
-        new_tag = re.sub(
-            rf'\b{attr}\s*=\s*["\'][^"\']*["\']',
-            f'{attr}="{value}"',
-            tag_open,
-        )
+        # A callable replacement keeps backslashes in the value literal
+        new_tag = _attr_value_re(attr).sub(lambda _: f'{attr}="{value}"', tag_open)
     else:
         # Insert before the closing >
         new_tag = tag_open[:-1] + f' {attr}="{value}">'
@@ -106,19 +134,156 @@ def _set_layer_attr(svg_xml: str, layer_id: str, attr: str, value: str) -> str:
 
 # ── Operation implementations ─────────────────────────────────────────────────
 
+# Operations that rewrite the SVG; every other operation only reads it
+_EDIT_OPERATIONS = ("create", "rename", "hide", "show", "reorder", "lock", "unlock")
+# Keys a batch step may carry: "operation" plus the parameters of _edit_layers
+_STEP_KEYS = frozenset({"operation", "layer_id", "label", "new_label", "position"})
+
+
+class _LayerEditError(Exception):
+    """An edit that cannot be applied; carries the fields of the failure result."""
+
+    def __init__(self, message: str, error: str = "", data: dict[str, Any] | None = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.error = error
+        self.data = data or {}
+
+
+def _edit_layers(
+    svg: str,
+    operation: str,
+    layer_id: str = "",
+    label: str = "",
+    new_label: str = "",
+    position: int = 0,
+) -> tuple[str, str, dict[str, Any]]:
+    """Apply one editing operation to SVG XML in memory.
+
+    Returns (new_svg, message, data); raises _LayerEditError when the edit cannot be applied.
+    """
+    if operation == "create":
+        lid = _next_layer_id(svg)
+        lbl = label or f"Layer {lid[len('layer'):]}"
+        layer_tag = _NEW_LAYER_TAG.format(id=lid, label=lbl)
+        # Insert before closing </svg>
+        if "</svg>" in svg:
+            new_svg = svg.replace("</svg>", f"  {layer_tag}\n</svg>")
+        else:
+            new_svg = svg + f"\n  {layer_tag}\n"
+        return new_svg, f"Created layer '{lid}' ({lbl})", {"id": lid, "label": lbl}
+
+    elif operation == "rename":
+        if not layer_id or not new_label:
+            raise _LayerEditError("layer_id and new_label are required", "ValueError")
+        new_svg = _set_layer_attr(svg, layer_id, "inkscape:label", new_label)
+        return new_svg, f"Renamed '{layer_id}' → '{new_label}'", {"id": layer_id, "label": new_label}
+
+    elif operation == "hide":
+        if not layer_id:
+            raise _LayerEditError("layer_id is required", "ValueError")
+        # Get current style or default
+        old_tag, attrs = _layer_by_id(svg, layer_id)
+        style = attrs.get("style")
+        if old_tag is not None and "display:none" in (style or ""):
+            # Already hidden: leave the document (and file) untouched
+            return svg, f"Hidden layer '{layer_id}'", {"id": layer_id, "style": style}
+        cur = style or "display:inline"
+        cur = cur.replace("display:inline;", "").replace("display:inline", "").strip()
+        new_style = ("display:none;" + cur).rstrip(";")
+        new_svg = _set_layer_attr(svg, layer_id, "style", new_style, old_tag)
+        return new_svg, f"Hidden layer '{layer_id}'", {"id": layer_id, "style": new_style}
+
+    elif operation == "show":
+        if not layer_id:
+            raise _LayerEditError("layer_id is required", "ValueError")
+        old_tag, attrs = _layer_by_id(svg, layer_id)
+        style = attrs.get("style")
+        if old_tag is not None and "display:none" not in (style or ""):
+            # Already visible: leave the document (and file) untouched
+            return svg, f"Showed layer '{layer_id}'", {"id": layer_id, "style": style or "display:inline"}
+        cur = style or "display:none"
+        cur = cur.replace("display:none;", "").replace("display:none", "").strip()
+        if not cur:
+            cur = "display:inline"
+        new_svg = _set_layer_attr(svg, layer_id, "style", cur, old_tag)
+        return new_svg, f"Showed layer '{layer_id}'", {"id": layer_id, "style": cur}
+
+    elif operation == "reorder":
+        # Move layer to position in <svg> child order; one scan yields both the
+        # layer count and the tag to move
+        scanned = _scan_layers(svg)
+        if position < 0 or position >= len(scanned):
+            raise _LayerEditError(f"Position {position} out of range (0-{len(scanned)-1})", "ValueError")
+        old_tag = next((tag for tag, attrs in scanned if attrs.get("id") == layer_id), None)
+        if old_tag is None:
+            raise _LayerEditError(
+                f"Layer '{layer_id}' not found", data={"available": [attrs.get("id") for _, attrs in scanned]}
+            )
+
+        # Remove the layer tag and re-insert at position
+        svg_without = svg.replace(old_tag + ("\n" if "\n" + old_tag in svg else ""), "\n<!-- reorder-temp -->\n")
+        # Re-insert: find the position-th <g after <svg>
+        parts = svg_without.split("<!-- reorder-temp -->")
+        if len(parts) != 2:
+            raise _LayerEditError("Internal error: could not split SVG at marker")
+        # Count <g> elements before insertion point; one scan serves every branch below
+        before = parts[0]
+        g_elements = list(_LAYER_OPEN_RE.finditer(before))
+        if position > len(g_elements):
+            position = len(g_elements)
+        if position == 0:
+            # Insert right after the first layer
+            if g_elements:
+                insert_pos = g_elements[0].start()
+                new_svg = before[:insert_pos] + old_tag + "\n" + before[insert_pos:]
+            else:
+                # No layers yet — insert after <svg ...> tag
+                match = _SVG_OPEN_RE.search(before)
+                insert_pos = match.end() if match else 0
+                new_svg = before[:insert_pos] + "\n  " + old_tag + "\n" + before[insert_pos:]
+        else:
+            target_g = g_elements[position - 1]
+            insert_pos = target_g.end()
+            new_svg = before[:insert_pos] + "\n" + old_tag + "\n" + before[insert_pos:]
+        new_svg = new_svg.replace("<!-- reorder-temp -->", "")
+        if parts[1]:
+            new_svg += parts[1]
+        return new_svg, f"Moved '{layer_id}' to position {position}", {"id": layer_id, "position": position}
+
+    elif operation == "lock":
+        if not layer_id:
+            raise _LayerEditError("layer_id is required", "ValueError")
+        new_svg = _set_layer_attr(svg, layer_id, "sodipodi:insensitive", "true")
+        return new_svg, f"Locked layer '{layer_id}'", {"id": layer_id}
+
+    elif operation == "unlock":
+        if not layer_id:
+            raise _LayerEditError("layer_id is required", "ValueError")
+        new_svg = _set_layer_attr(svg, layer_id, "sodipodi:insensitive", "false")
+        return new_svg, f"Unlocked layer '{layer_id}'", {"id": layer_id}
+
+    raise _LayerEditError(f"Unknown operation: {operation}", "ValueError")
+
 
 async def inkscape_layers(
-    operation: Literal["list", "get", "create", "rename", "hide", "show", "reorder", "lock", "unlock"],
+    operation: Literal["list", "get", "create", "rename", "hide", "show", "reorder", "lock", "unlock", "batch"],
     input_path: str = "",
     output_path: str = "",
     layer_id: str = "",
     label: str = "",
     new_label: str = "",
     position: int = 0,
+    steps: list[dict[str, Any]] | None = None,
     _cli_wrapper: Any = None,
     _config: Any = None,
 ) -> dict[str, Any]:
-    """Inkscape layer management portmanteau tool."""
+    """Inkscape layer management portmanteau tool.
+
+    operation="batch" applies `steps` in order (each a dict with "operation" plus that
+    operation's parameters) reading the SVG once and writing it once; nothing is written
+    if any step fails.
+    """
     _start = time.time()
 
     def ok(op: str, msg: str, data: dict[str, Any]) -> dict[str, Any]:
@@ -133,11 +298,14 @@ async def inkscape_layers(
             data=data or {}, error=err, execution_time_ms=0,
         ).model_dump()
 
-    if not input_path or not Path(input_path).exists():
+    if not input_path:
         return fail(operation, f"File not found: {input_path}", "FileNotFoundError")
 
+    # Read directly rather than checking exists() first: one syscall fewer and no race
     try:
         svg = _parse_svg_xml(input_path)
+    except FileNotFoundError:
+        return fail(operation, f"File not found: {input_path}", "FileNotFoundError")
     except Exception as e:
         return fail(operation, f"Cannot read SVG: {e}", str(e))
 
@@ -153,124 +321,49 @@ async def inkscape_layers(
                 return fail("get", f"Layer '{layer_id}' not found", data={"available": [ly["id"] for ly in layers]})
             return ok("get", f"Layer: {layer_id}", {"layer": match})
 
-        elif operation == "create":
-            lid = _next_layer_id(svg)
-            lbl = label or f"Layer {lid[len('layer'):]}"
-            layer_tag = (
-                f'<g\n'
-                f'    inkscape:groupmode="layer"\n'
-                f'    id="{lid}"\n'
-                f'    inkscape:label="{lbl}">\n'
-                f'  </g>'
-            )
-            # Insert before closing </svg>
-            if "</svg>" in svg:
-                new_svg = svg.replace("</svg>", f"  {layer_tag}\n</svg>")
-            else:
-                new_svg = svg + f"\n  {layer_tag}\n"
+        elif operation == "batch":
+            if not steps:
+                return fail("batch", "steps is required", "ValueError")
+            results: list[dict[str, Any]] = []
+            original = svg
+            for i, step in enumerate(steps):
+                if not isinstance(step, dict):
+                    return fail("batch", f"Step {i}: expected an object, got {type(step).__name__}", "ValueError")
+                step_op = step.get("operation", "")
+                if step_op not in _EDIT_OPERATIONS:
+                    return fail("batch", f"Step {i}: unsupported operation '{step_op}'", "ValueError")
+                unknown = sorted(map(str, step.keys() - _STEP_KEYS))
+                if unknown:
+                    return fail("batch", f"Step {i} ({step_op}): unknown key(s) {', '.join(unknown)}", "ValueError")
+                params = {k: v for k, v in step.items() if k != "operation"}
+                try:
+                    svg, _, data = _edit_layers(svg, step_op, **params)
+                except _LayerEditError as e:
+                    return fail("batch", f"Step {i} ({step_op}): {e.message}", e.error, e.data)
+                except ValueError as e:
+                    return fail("batch", f"Step {i} ({step_op}): {e}", "ValueError")
+                results.append({"operation": step_op, **data})
             dest = output_path or input_path
-            _write_svg_xml(dest, new_svg)
-            return ok("create", f"Created layer '{lid}' ({lbl})", {"id": lid, "label": lbl, "path": dest})
+            if dest != input_path or svg != original:
+                _write_svg_xml(dest, svg)
+            return ok("batch", f"Applied {len(results)} layer operation(s)", {"results": results, "path": dest})
 
-        elif operation == "rename":
-            if not layer_id or not new_label:
-                return fail("rename", "layer_id and new_label are required", "ValueError")
-            new_svg = _set_layer_attr(svg, layer_id, "inkscape:label", new_label)
-            dest = output_path or input_path
-            _write_svg_xml(dest, new_svg)
-            return ok("rename", f"Renamed '{layer_id}' → '{new_label}'", {"id": layer_id, "label": new_label})
-
-        elif operation == "hide":
-            if not layer_id:
-                return fail("hide", "layer_id is required", "ValueError")
-            # Get current style or default
-            _, attrs = _layer_by_id(svg, layer_id)
-            cur = attrs.get("style") or "display:inline"
-            cur = cur.replace("display:inline;", "").replace("display:inline", "").strip()
-            new_style = ("display:none;" + cur).rstrip(";")
-            new_svg = _set_layer_attr(svg, layer_id, "style", new_style)
-            dest = output_path or input_path
-            _write_svg_xml(dest, new_svg)
-            return ok("hide", f"Hidden layer '{layer_id}'", {"id": layer_id, "style": new_style})
-
-        elif operation == "show":
-            if not layer_id:
-                return fail("show", "layer_id is required", "ValueError")
-            _, attrs = _layer_by_id(svg, layer_id)
-            cur = attrs.get("style") or "display:none"
-            cur = cur.replace("display:none;", "").replace("display:none", "").strip()
-            if not cur:
-                cur = "display:inline"
-            new_svg = _set_layer_attr(svg, layer_id, "style", cur)
-            dest = output_path or input_path
-            _write_svg_xml(dest, new_svg)
-            return ok("show", f"Showed layer '{layer_id}'", {"id": layer_id, "style": cur})
-
-        elif operation == "reorder":
-            # Move layer to position in <svg> child order
-            layers = _extract_layers(svg)
-            if position < 0 or position >= len(layers):
-                return fail("reorder", f"Position {position} out of range (0-{len(layers)-1})", "ValueError")
-            target = next((ly for ly in layers if ly["id"] == layer_id), None)
-            if not target:
-                return fail("reorder", f"Layer '{layer_id}' not found", data={"available": [ly["id"] for ly in layers]})
-
-            # Remove the layer tag and re-insert at position
-            old_tag, _ = _layer_by_id(svg, layer_id)
-            if old_tag is None:
-                return fail("reorder", f"Cannot read layer tag for '{layer_id}'")
-            svg_without = svg.replace(old_tag + ("\n" if "\n" + old_tag in svg else ""), "\n<!-- reorder-temp -->\n")
-            # Re-insert: find the position-th <g after <svg>
-            parts = svg_without.split("<!-- reorder-temp -->")
-            if len(parts) != 2:
-                return fail("reorder", "Internal error: could not split SVG at marker")
-            # Count <g> elements before insertion point
-            before = parts[0]
-            g_elements = list(re.finditer(r"<g\b[^>]*inkscape:groupmode=\"layer\"[^>]*>", before))
-            if position > len(g_elements):
-                position = len(g_elements)
-            if position == 0:
-                # Insert right after the first layer
-                first = re.search(r"<g\b[^>]*inkscape:groupmode=\"layer\"[^>]*>", before)
-                if first:
-                    insert_pos = first.start()
-                    new_svg = before[:insert_pos] + old_tag + "\n" + before[insert_pos:]
-                else:
-                    # No layers yet — insert after <svg ...> tag
-                    match = re.search(r"<svg\b[^>]*>", before)
-                    insert_pos = match.end() if match else 0
-                    new_svg = before[:insert_pos] + "\n  " + old_tag + "\n" + before[insert_pos:]
-            else:
-                g_list = list(re.finditer(r"<g\b[^>]*inkscape:groupmode=\"layer\"[^>]*>", before))
-                target_g = g_list[position - 1]
-                insert_pos = target_g.end()
-                new_svg = before[:insert_pos] + "\n" + old_tag + "\n" + before[insert_pos:]
-            new_svg = new_svg.replace("<!-- reorder-temp -->", "")
-            if parts[1]:
-                new_svg += parts[1]
-
-            dest = output_path or input_path
-            _write_svg_xml(dest, new_svg)
-            return ok("reorder", f"Moved '{layer_id}' to position {position}", {"id": layer_id, "position": position})
-
-        elif operation == "lock":
-            if not layer_id:
-                return fail("lock", "layer_id is required", "ValueError")
-            new_svg = _set_layer_attr(svg, layer_id, "sodipodi:insensitive", "true")
-            dest = output_path or input_path
-            _write_svg_xml(dest, new_svg)
-            return ok("lock", f"Locked layer '{layer_id}'", {"id": layer_id})
-
-        elif operation == "unlock":
-            if not layer_id:
-                return fail("unlock", "layer_id is required", "ValueError")
-            new_svg = _set_layer_attr(svg, layer_id, "sodipodi:insensitive", "false")
+        elif operation in _EDIT_OPERATIONS:
+            new_svg, msg, data = _edit_layers(
+                svg, operation, layer_id=layer_id, label=label, new_label=new_label, position=position
+            )
             dest = output_path or input_path
-            _write_svg_xml(dest, new_svg)
-            return ok("unlock", f"Unlocked layer '{layer_id}'", {"id": layer_id})
+            # Hiding a hidden layer, locking a locked one etc. leaves the file untouched
+            if dest != input_path or new_svg != svg:
+                _write_svg_xml(dest, new_svg)
+            if operation == "create":
+                data["path"] = dest
+            return ok(operation, msg, data)
 
         else:
             return fail(operation, f"Unknown operation: {operation}", "ValueError")
 
+    except _LayerEditError as e:
+        return fail(operation, e.message, e.error, e.data)
     except Exception as e:
         return fail(operation, f"Layer operation failed: {e}", str(e))
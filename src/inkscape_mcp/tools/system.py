@@ -486,12 +486,8 @@ async def inkscape_system(
                     "inkscape_executable": str(config.inkscape_executable)
                     if config.inkscape_executable
                     else None,
-                    "process_timeout": config.process_timeout
-                    if hasattr(config, "process_timeout")
-                    else None,
-                    "max_concurrent_processes": config.max_concurrent_processes
-                    if hasattr(config, "max_concurrent_processes")
-                    else None,
+                    "process_timeout": getattr(config, "process_timeout", None),
+                    "max_concurrent_processes": getattr(config, "max_concurrent_processes", None),
                 }
 
             return SystemResult(
@@ -1056,6 +1056,15 @@ async def _render_preview(
         ).model_dump()
 
 
+# Boolean operation types mapped to Inkscape actions
+_BOOLEAN_ACTIONS = {
+    "union": "selection-union",
+    "difference": "selection-difference",
+    "intersection": "selection-intersection",
+    "exclusion": "selection-exclusion",
+}
+
+
 async def _apply_boolean(
     boolean_type: str,
     input_path: str,
@@ -1082,15 +1091,7 @@ async def _apply_boolean(
                 error="ValueError",
             ).model_dump()
 
-        # Map operation types to Inkscape actions
-        operation_map = {
-            "union": "selection-union",
-            "difference": "selection-difference",
-            "intersection": "selection-intersection",
-            "exclusion": "selection-exclusion",
-        }
-
-        if boolean_type not in operation_map:
+        if boolean_type not in _BOOLEAN_ACTIONS:
             return VectorOperationResult(
                 success=False,
                 operation="apply_boolean",
@@ -1100,7 +1101,7 @@ async def _apply_boolean(
                 error="ValueError",
             ).model_dump()
 
-        operation_action = operation_map[boolean_type]
+        operation_action = _BOOLEAN_ACTIONS[boolean_type]
 
         # MANDATORY: Complete action chain with export for persistence
         actions = f"{select_action};{operation_action};export-filename:{output_path};export-do"
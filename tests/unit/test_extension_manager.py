@@ -0,0 +1,441 @@
+"""
+Unit tests for the Inkscape MCP extension manager.
+"""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from inkscape_mcp.config import InkscapeConfig
+from inkscape_mcp.plugins.extension_manager import ExtensionManager
+
+PLUGINS_DIR = Path(__file__).resolve().parents[2] / "src" / "inkscape_mcp" / "plugins"
+
+SAMPLE_INX = """<?xml version="1.0" encoding="UTF-8"?>
+<inkscape-extension xmlns="http://www.inkscape.org/namespace/inkscape/extension">
+    <name>Sample Effect</name>
+    <id>org.test.sample</id>
+    <param name="count" type="int" min="1" max="10" gui-text="Count">3</param>
+    <param name="scale" type="float" gui-text="Scale">1.5</param>
+    <param name="enabled" type="bool" gui-text="Enabled">true</param>
+    <param name="label" type="string" gui-text="Label">hello</param>
+    <effect>
+        <effects-menu>
+            <submenu>Test Tools</submenu>
+        </effects-menu>
+    </effect>
+    <script>
+        <command location="inx" interpreter="python">sample.py</command>
+    </script>
+</inkscape-extension>
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Directory holding the discovery cache."""
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def manager(cache_dir):
+    """Create an extension manager without a CLI wrapper."""
+    return ExtensionManager(None, InkscapeConfig(temp_directory=str(cache_dir)))
+
+
+@pytest.fixture
+def sample_extension_dir(tmp_path):
+    """Create a directory holding one sample extension."""
+    ext_dir = tmp_path / "extensions"
+    ext_dir.mkdir()
+    (ext_dir / "sample.inx").write_text(SAMPLE_INX, encoding="utf-8")
+    (ext_dir / "sample.py").write_text("", encoding="utf-8")
+    return ext_dir
+
+
+class TestExtensionDiscovery:
+    """Test discovery and parsing of .inx files."""
+
+    def test_discovers_bundled_plugins(self, manager):
+        """Test the bundled Project AG extensions are discovered."""
+        manager.discover_extensions([str(PLUGINS_DIR)])
+
+        assert set(manager.extensions) == {
+            "org.project_ag.batch_trace",
+            "org.project_ag.color_quantize",
+            "org.project_ag.layer_animation",
+            "org.project_ag.unity_prep",
+        }
+
+    def test_parses_metadata_and_parameters(self, manager, sample_extension_dir):
+        """Test namespaced .inx metadata and typed parameter defaults."""
+        manager.discover_extensions([str(sample_extension_dir)])
+
+        extension = manager.get_extension("org.test.sample")
+        assert extension is not None
+        assert extension.name == "Sample Effect"
+        assert extension.category == "test_tools"
+        assert extension.python_file == sample_extension_dir / "sample.py"
+
+        params = {param.name: param for param in extension.parameters}
+        assert params["count"].default == 3
+        assert params["count"].min_val == 1.0
+        assert params["count"].max_val == 10.0
+        assert params["scale"].default == 1.5
+        assert params["enabled"].default is True
+        assert params["label"].default == "hello"
+
+    def test_extension_is_hashable(self, manager, sample_extension_dir):
+        """Test a discovered extension is immutable and hashable."""
+        manager.discover_extensions([str(sample_extension_dir)])
+
+        extension = manager.get_extension("org.test.sample")
+        assert isinstance(extension.parameters, tuple)
+        assert hash(extension) == hash(manager.get_extension("org.test.sample"))
+
+    def test_skips_extension_without_script(self, manager, sample_extension_dir):
+        """Test an .inx whose script is missing is not loaded."""
+        (sample_extension_dir / "sample.py").unlink()
+
+        manager.discover_extensions([str(sample_extension_dir)])
+
+        assert manager.extensions == {}
+
+    def test_malformed_inx_is_ignored(self, manager, sample_extension_dir):
+        """Test a malformed .inx does not stop discovery of the others."""
+        (sample_extension_dir / "broken.inx").write_text("<inkscape-extension>", encoding="utf-8")
+
+        manager.discover_extensions([str(sample_extension_dir)])
+
+        assert list(manager.extensions) == ["org.test.sample"]
+
+    def test_later_directory_overrides_earlier(self, manager, sample_extension_dir, tmp_path):
+        """Test an extension id found in a later directory replaces the earlier one."""
+        override_dir = tmp_path / "override"
+        override_dir.mkdir()
+        (override_dir / "sample.inx").write_text(
+            SAMPLE_INX.replace("Sample Effect", "Override Effect"), encoding="utf-8"
+        )
+        (override_dir / "sample.py").write_text("", encoding="utf-8")
+
+        manager.discover_extensions([str(sample_extension_dir), str(override_dir)])
+
+        assert manager.get_extension("org.test.sample").name == "Override Effect"
+
+    def test_same_directory_is_parsed_once(self, manager, sample_extension_dir, tmp_path):
+        """Test a directory reachable through a symlink is not parsed twice."""
+        link = tmp_path / "link"
+        link.symlink_to(sample_extension_dir, target_is_directory=True)
+
+        with patch.object(
+            ExtensionManager,
+            "_parse_inx_file",
+            autospec=True,
+            side_effect=ExtensionManager._parse_inx_file,
+        ) as parse:
+            manager.discover_extensions([str(sample_extension_dir), str(link), str(link)])
+
+        assert parse.call_count == 1
+        assert list(manager.extensions) == ["org.test.sample"]
+
+    def test_unreadable_directory_is_skipped(self, manager, sample_extension_dir, tmp_path):
+        """Test a directory that cannot be scanned does not stop discovery of the others."""
+        locked_dir = tmp_path / "locked"
+        locked_dir.mkdir()
+        scandir = os.scandir
+
+        def fake_scandir(path):
+            if Path(path) == locked_dir:
+                raise PermissionError(13, "Permission denied", str(path))
+            return scandir(path)
+
+        with patch("os.scandir", side_effect=fake_scandir):
+            manager.discover_extensions([str(locked_dir), str(sample_extension_dir)])
+
+        assert list(manager.extensions) == ["org.test.sample"]
+
+    def test_missing_directory(self, manager, tmp_path):
+        """Test a missing directory is skipped."""
+        manager.discover_extensions([str(tmp_path / "missing")])
+
+        assert manager.extensions == {}
+
+
+class TestDiscoveryCache:
+    """Test the on-disk cache of parsed extensions."""
+
+    def test_unchanged_files_are_not_reparsed(self, cache_dir, sample_extension_dir):
+        """Test a second discovery loads unchanged .inx files from the cache."""
+        config = InkscapeConfig(temp_directory=str(cache_dir))
+        ExtensionManager(None, config).discover_extensions([str(sample_extension_dir)])
+
+        warm = ExtensionManager(None, config)
+        with patch.object(ExtensionManager, "_parse_inx_file") as parse:
+            warm.discover_extensions([str(sample_extension_dir)])
+
+        parse.assert_not_called()
+        extension = warm.get_extension("org.test.sample")
+        assert isinstance(extension.parameters, tuple)
+        assert extension.python_file == sample_extension_dir / "sample.py"
+        assert {param.name: param.default for param in extension.parameters} == {
+            "count": 3,
+            "scale": 1.5,
+            "enabled": True,
+            "label": "hello",
+        }
+
+    def test_modified_file_is_reparsed(self, cache_dir, sample_extension_dir):
+        """Test an .inx whose size or mtime changed is parsed again."""
+        config = InkscapeConfig(temp_directory=str(cache_dir))
+        ExtensionManager(None, config).discover_extensions([str(sample_extension_dir)])
+
+        (sample_extension_dir / "sample.inx").write_text(
+            SAMPLE_INX.replace("Sample Effect", "Renamed Effect"), encoding="utf-8"
+        )
+        warm = ExtensionManager(None, config)
+        warm.discover_extensions([str(sample_extension_dir)])
+
+        assert warm.get_extension("org.test.sample").name == "Renamed Effect"
+
+    def test_corrupt_cache_is_ignored(self, cache_dir, sample_extension_dir):
+        """Test an unreadable cache file falls back to parsing."""
+        manager = ExtensionManager(None, InkscapeConfig(temp_directory=str(cache_dir)))
+        manager._discovery_cache_path().write_text("{not json", encoding="utf-8")
+
+        manager.discover_extensions([str(sample_extension_dir)])
+
+        assert "org.test.sample" in manager.extensions
+
+    @pytest.mark.parametrize(
+        "entries",
+        [
+            [],
+            {"sample.inx": {"size": 0, "extension": {}}},
+            {"sample.inx": "stale"},
+        ],
+        ids=["entries_not_a_dict", "entry_without_mtime", "entry_not_a_dict"],
+    )
+    def test_malformed_cache_is_ignored(self, cache_dir, sample_extension_dir, entries):
+        """Test a cache with the right version but the wrong shape falls back to parsing."""
+        if isinstance(entries, dict):
+            entries = {str(sample_extension_dir / name): entry for name, entry in entries.items()}
+        manager = ExtensionManager(None, InkscapeConfig(temp_directory=str(cache_dir)))
+        manager._discovery_cache_path().write_text(
+            json.dumps({"version": 1, "entries": entries}), encoding="utf-8"
+        )
+
+        manager.discover_extensions([str(sample_extension_dir)])
+
+        assert "org.test.sample" in manager.extensions
+
+    def test_malformed_cached_parameter_is_reparsed(self, cache_dir, sample_extension_dir):
+        """Test a cached extension that cannot be rebuilt is parsed again."""
+        config = InkscapeConfig(temp_directory=str(cache_dir))
+        cold = ExtensionManager(None, config)
+        cold.discover_extensions([str(sample_extension_dir)])
+
+        cache_file = cold._discovery_cache_path()
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        for entry in data["entries"].values():
+            del entry["extension"]["parameters"][0]["type"]
+        cache_file.write_text(json.dumps(data), encoding="utf-8")
+
+        warm = ExtensionManager(None, config)
+        warm.discover_extensions([str(sample_extension_dir)])
+
+        extension = warm.get_extension("org.test.sample")
+        assert [param.type for param in extension.parameters] == ["int", "float", "bool", "string"]
+
+    def test_cache_write_leaves_no_temp_files(self, cache_dir, sample_extension_dir):
+        """Test the cache is written atomically without leftover temp files."""
+        manager = ExtensionManager(None, InkscapeConfig(temp_directory=str(cache_dir)))
+        manager.discover_extensions([str(sample_extension_dir)])
+
+        cache_file = manager._discovery_cache_path()
+        assert [path.name for path in cache_file.parent.iterdir()] == [cache_file.name]
+
+    def test_cache_is_kept_out_of_the_shared_temp_directory(self, cache_dir, sample_extension_dir):
+        """Test a cache file planted directly in the temp directory is not loaded."""
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / "inkscape_mcp_extensions.json").write_text(
+            json.dumps({"version": 1, "entries": {}}), encoding="utf-8"
+        )
+
+        manager = ExtensionManager(None, InkscapeConfig(temp_directory=str(cache_dir)))
+        manager.discover_extensions([str(sample_extension_dir)])
+
+        cache_file = manager._discovery_cache_path()
+        assert cache_file.parent != cache_dir
+        entries = json.loads(cache_file.read_text(encoding="utf-8"))["entries"]
+        assert str(sample_extension_dir / "sample.inx") in entries
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+    def test_cache_directory_open_to_others_is_not_used(self, cache_dir, sample_extension_dir):
+        """Test a cache directory other users can write to is neither read nor written."""
+        config = InkscapeConfig(temp_directory=str(cache_dir))
+        ExtensionManager(None, config).discover_extensions([str(sample_extension_dir)])
+
+        warm = ExtensionManager(None, config)
+        cache_file = warm._discovery_cache_path()
+        cache_file.parent.chmod(0o777)
+        with patch.object(
+            ExtensionManager,
+            "_parse_inx_file",
+            autospec=True,
+            side_effect=ExtensionManager._parse_inx_file,
+        ) as parse:
+            warm.discover_extensions([str(sample_extension_dir)])
+
+        assert parse.call_count == 1
+        assert warm._discovery_cache_path() is None
+
+
+class TestExtensionListing:
+    """Test listing and lookup of discovered extensions."""
+
+    def test_list_extensions(self, manager, sample_extension_dir):
+        """Test listed extension info and category filtering."""
+        manager.discover_extensions([str(sample_extension_dir)])
+
+        listed = manager.list_extensions()
+        assert len(listed) == 1
+        assert listed[0]["id"] == "org.test.sample"
+        assert [param["name"] for param in listed[0]["parameters"]] == [
+            "count",
+            "scale",
+            "enabled",
+            "label",
+        ]
+
+        assert manager.list_extensions(category="test_tools") == listed
+        assert manager.list_extensions(category="other") == []
+
+    def test_listed_entries_are_read_only(self, manager, sample_extension_dir):
+        """Test listings share read-only entries built once at discovery."""
+        manager.discover_extensions([str(sample_extension_dir)])
+
+        listed = manager.list_extensions()
+        with pytest.raises(TypeError):
+            listed[0]["name"] = "Changed"
+        with pytest.raises(TypeError):
+            listed[0]["parameters"][0]["name"] = "changed"
+        assert not hasattr(listed[0]["parameters"], "clear")
+
+        assert manager.list_extensions()[0] is listed[0]
+
+    def test_category_follows_override(self, manager, sample_extension_dir, tmp_path):
+        """Test an overriding extension is listed under its own category only."""
+        override_dir = tmp_path / "override"
+        override_dir.mkdir()
+        (override_dir / "sample.inx").write_text(
+            SAMPLE_INX.replace("Test Tools", "Other Tools"), encoding="utf-8"
+        )
+        (override_dir / "sample.py").write_text("", encoding="utf-8")
+
+        manager.discover_extensions([str(sample_extension_dir), str(override_dir)])
+
+        assert manager.list_extensions(category="test_tools") == []
+        assert [info["id"] for info in manager.list_extensions(category="other_tools")] == [
+            "org.test.sample"
+        ]
+
+    def test_get_unknown_extension(self, manager):
+        """Test looking up an unknown extension returns None."""
+        assert manager.get_extension("org.test.unknown") is None
+
+
+class TestExtensionExecution:
+    """Test running discovered extensions through the CLI wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_concurrently_within_limit(self, cache_dir, sample_extension_dir):
+        """Test batch runs keep spec order and respect max_concurrent_processes."""
+        running = 0
+        peak = 0
+
+        async def fake_execute(cmd, **_kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return cmd[-1]
+
+        cli_wrapper = MagicMock()
+        cli_wrapper._execute_command = fake_execute
+        config = InkscapeConfig(temp_directory=str(cache_dir), max_concurrent_processes=2)
+        manager = ExtensionManager(cli_wrapper, config)
+        manager.discover_extensions([str(sample_extension_dir)])
+
+        specs = [
+            {"extension_id": "org.test.sample", "parameters": {"count": count}}
+            for count in range(5)
+        ]
+        specs.append({"extension_id": "org.test.unknown"})
+        results = await manager.execute_extension_batch(specs)
+
+        assert [result["output"] for result in results[:5]] == ["0", "1", "2", "3", "4"]
+        assert results[5]["success"] is False
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_command_line(self, cache_dir, sample_extension_dir):
+        """Test the Inkscape argv built for an extension run."""
+        cli_wrapper = MagicMock()
+        cli_wrapper._execute_command = AsyncMock(return_value="")
+        config = InkscapeConfig(temp_directory=str(cache_dir), inkscape_executable="inkscape")
+        manager = ExtensionManager(cli_wrapper, config)
+        manager.discover_extensions([str(sample_extension_dir)])
+
+        await manager.execute_extension(
+            "org.test.sample", "in.svg", "out.svg", {"count": 4, "enabled": True}
+        )
+
+        cli_wrapper._execute_command.assert_awaited_once_with(
+            [
+                "inkscape",
+                "in.svg",
+                "--extension",
+                "org.test.sample",
+                "--count",
+                "4",
+                "--enabled",
+                "True",
+                "--export-filename",
+                "out.svg",
+                "--export-do",
+            ],
+            timeout=60,
+        )
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_calls_share_one_run(self, cache_dir, sample_extension_dir):
+        """Test duplicate in-flight calls run Inkscape once and each get a result."""
+
+        async def fake_execute(*_args, **_kwargs):
+            await asyncio.sleep(0.01)
+            return "done"
+
+        cli_wrapper = MagicMock()
+        cli_wrapper._execute_command = AsyncMock(side_effect=fake_execute)
+        manager = ExtensionManager(cli_wrapper, InkscapeConfig(temp_directory=str(cache_dir)))
+        manager.discover_extensions([str(sample_extension_dir)])
+
+        first, second = await asyncio.gather(
+            manager.execute_extension("org.test.sample", "in.svg", parameters={"count": 2}),
+            manager.execute_extension("org.test.sample", "in.svg", parameters={"count": 2}),
+        )
+
+        assert cli_wrapper._execute_command.await_count == 1
+        assert first == second
+        assert first is not second
+        assert first["output"] == "done"
+
+        await manager.execute_extension("org.test.sample", "in.svg", parameters={"count": 2})
+        assert cli_wrapper._execute_command.await_count == 2
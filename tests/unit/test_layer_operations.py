@@ -0,0 +1,185 @@
+"""Tests for the inkscape_layers portmanteau tool."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from inkscape_mcp.tools.layer_operations import inkscape_layers
+
+LAYERED_SVG = """<svg xmlns="http://www.w3.org/2000/svg"
+     xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"
+     xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd" viewBox="0 0 100 100">
+<g id="g1" inkscape:groupmode="layer" inkscape:label="Background"><rect width="10" height="10"/></g>
+<g id="g2" inkscape:groupmode="layer" inkscape:label="Foreground"><circle r="5"/></g>
+</svg>
+"""
+
+
+@pytest.fixture
+def layered_svg(tmp_path: Path) -> Path:
+    path = tmp_path / "layers.svg"
+    path.write_text(LAYERED_SVG, encoding="utf-8")
+    return path
+
+
+class TestLayerEdits:
+    @pytest.mark.asyncio
+    async def test_list_layers(self, layered_svg: Path):
+        result = await inkscape_layers("list", input_path=str(layered_svg))
+
+        assert result["success"] is True
+        assert [layer["label"] for layer in result["data"]["layers"]] == [
+            "Background",
+            "Foreground",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_hide_then_show(self, layered_svg: Path):
+        hidden = await inkscape_layers("hide", input_path=str(layered_svg), layer_id="g1")
+        assert hidden["data"]["style"] == "display:none"
+
+        await inkscape_layers("show", input_path=str(layered_svg), layer_id="g1")
+        result = await inkscape_layers("get", input_path=str(layered_svg), layer_id="g1")
+        assert result["data"]["layer"]["visible"] is True
+
+    @pytest.mark.asyncio
+    async def test_noop_edit_does_not_rewrite(self, layered_svg: Path):
+        await inkscape_layers("lock", input_path=str(layered_svg), layer_id="g1")
+
+        with patch("inkscape_mcp.tools.layer_operations._write_svg_xml") as write:
+            result = await inkscape_layers("lock", input_path=str(layered_svg), layer_id="g1")
+
+        assert result["success"] is True
+        write.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hide_and_show_are_idempotent(self, layered_svg: Path):
+        await inkscape_layers("hide", input_path=str(layered_svg), layer_id="g1")
+        hidden_once = layered_svg.read_text(encoding="utf-8")
+
+        again = await inkscape_layers("hide", input_path=str(layered_svg), layer_id="g1")
+        assert again["data"]["style"] == "display:none"
+        assert layered_svg.read_text(encoding="utf-8") == hidden_once
+
+        await inkscape_layers("show", input_path=str(layered_svg), layer_id="g2")
+        assert layered_svg.read_text(encoding="utf-8") == hidden_once
+
+    @pytest.mark.asyncio
+    async def test_reorder_to_front(self, layered_svg: Path):
+        result = await inkscape_layers("reorder", input_path=str(layered_svg), layer_id="g2")
+        assert result["success"] is True
+
+        layers = (await inkscape_layers("list", input_path=str(layered_svg)))["data"]["layers"]
+        assert [layer["id"] for layer in layers] == ["g2", "g1"]
+
+    @pytest.mark.asyncio
+    async def test_reorder_unknown_layer_lists_available(self, layered_svg: Path):
+        result = await inkscape_layers("reorder", input_path=str(layered_svg), layer_id="nope")
+
+        assert result["success"] is False
+        assert result["data"]["available"] == ["g1", "g2"]
+
+    @pytest.mark.asyncio
+    async def test_rename_keeps_backslashes(self, layered_svg: Path):
+        label = r"C:\1 art"
+        result = await inkscape_layers(
+            "rename", input_path=str(layered_svg), layer_id="g1", new_label=label
+        )
+        assert result["success"] is True
+
+        result = await inkscape_layers("get", input_path=str(layered_svg), layer_id="g1")
+        assert result["data"]["layer"]["label"] == label
+
+    @pytest.mark.asyncio
+    async def test_missing_layer(self, layered_svg: Path):
+        result = await inkscape_layers("lock", input_path=str(layered_svg), layer_id="nope")
+
+        assert result["success"] is False
+        assert layered_svg.read_text(encoding="utf-8") == LAYERED_SVG
+
+
+class TestLayerBatch:
+    @pytest.mark.asyncio
+    async def test_batch_applies_steps_in_order(self, layered_svg: Path, tmp_path: Path):
+        out = tmp_path / "out.svg"
+        result = await inkscape_layers(
+            "batch",
+            input_path=str(layered_svg),
+            output_path=str(out),
+            steps=[
+                {"operation": "create", "label": "Ink"},
+                {"operation": "rename", "layer_id": "g2", "new_label": "Top"},
+                {"operation": "hide", "layer_id": "g1"},
+                {"operation": "lock", "layer_id": "layer1"},
+            ],
+        )
+
+        assert result["success"] is True
+        assert [step["operation"] for step in result["data"]["results"]] == [
+            "create",
+            "rename",
+            "hide",
+            "lock",
+        ]
+        layers = (await inkscape_layers("list", input_path=str(out)))["data"]["layers"]
+        assert [(layer["id"], layer["label"]) for layer in layers] == [
+            ("g1", "Background"),
+            ("g2", "Top"),
+            ("layer1", "Ink"),
+        ]
+        assert layers[0]["visible"] is False
+        assert layers[2]["locked"] is True
+        assert layered_svg.read_text(encoding="utf-8") == LAYERED_SVG
+
+    @pytest.mark.asyncio
+    async def test_failed_step_writes_nothing(self, layered_svg: Path):
+        result = await inkscape_layers(
+            "batch",
+            input_path=str(layered_svg),
+            steps=[
+                {"operation": "hide", "layer_id": "g1"},
+                {"operation": "rename", "layer_id": "g2"},
+            ],
+        )
+
+        assert result["success"] is False
+        assert result["message"].startswith("Step 1 (rename)")
+        assert layered_svg.read_text(encoding="utf-8") == LAYERED_SVG
+
+    @pytest.mark.asyncio
+    async def test_missing_layer_step_reports_index(self, layered_svg: Path):
+        result = await inkscape_layers(
+            "batch",
+            input_path=str(layered_svg),
+            steps=[
+                {"operation": "hide", "layer_id": "g1"},
+                {"operation": "lock", "layer_id": "nope"},
+            ],
+        )
+
+        assert result["success"] is False
+        assert result["message"] == "Step 1 (lock): Layer 'nope' not found"
+        assert layered_svg.read_text(encoding="utf-8") == LAYERED_SVG
+
+    @pytest.mark.asyncio
+    async def test_unknown_step_key_is_rejected(self, layered_svg: Path):
+        result = await inkscape_layers(
+            "batch",
+            input_path=str(layered_svg),
+            steps=[{"operation": "hide", "layer_id": "g1", "foo": 1}],
+        )
+
+        assert result["success"] is False
+        assert result["message"] == "Step 0 (hide): unknown key(s) foo"
+        assert "_edit_layers" not in result["message"]
+        assert layered_svg.read_text(encoding="utf-8") == LAYERED_SVG
+
+    @pytest.mark.asyncio
+    async def test_non_dict_step_is_rejected(self, layered_svg: Path):
+        result = await inkscape_layers("batch", input_path=str(layered_svg), steps=["hide"])
+
+        assert result["success"] is False
+        assert result["message"] == "Step 0: expected an object, got str"